@@ -19,12 +19,35 @@ class ChatActivity : AppCompatActivity() {
     private lateinit var binding: ActivityChatBinding
     private lateinit var messageAdapter: MessageAdapter
     private val sharedPrefs by lazy { getSharedPreferences("LoginApp", Context.MODE_PRIVATE) }
+    private val currentUser by lazy { sharedPrefs.getString("logged_user", "") ?: "" }
+    private val currentUserName by lazy { sharedPrefs.getString("logged_user_name", currentUser) ?: currentUser }
+    // Preferências do usuário abertas uma vez e reutilizadas em cada leitura/escrita
+    private val userPrefs by lazy { getSharedPreferences("users_$currentUser", Context.MODE_PRIVATE) }
 
     private var chatId: String = ""
     private var chatName: String = ""
+    private var messagesKey: String = ""
 
     companion object {
         private const val KEY_MESSAGES = "messages_"
+
+        // Respostas automáticas simuladas
+        private val replies = listOf(
+            "Entendi! 👍",
+            "Que legal! 😄",
+            "Pode me contar mais?",
+            "Ok, sem problemas!",
+            "Entendido!",
+            "Haha, muito bom! 😂",
+            "Vamos lá! 🚀",
+            "Perfeito! ✨"
+        )
+
+        // Resolvido uma única vez em vez de criar um TypeToken anônimo a cada leitura
+        private val messageListType = object : TypeToken<MutableList<Message>>() {}.type
+
+        // Instância única: o Gson guarda em cache os adapters por tipo
+        private val gson = Gson()
     }
 
     override fun onCreate(savedInstanceState: Bundle?) {
@@ -39,6 +62,7 @@ class ChatActivity : AppCompatActivity() {
             return
         }
         chatName = intent.getStringExtra("chat_name") ?: "Chat"
+        messagesKey = KEY_MESSAGES + chatId
 
         setupToolbar()
         setupRecyclerView()
@@ -53,8 +77,7 @@ class ChatActivity : AppCompatActivity() {
     }
 
     private fun setupRecyclerView() {
-        val currentUserId = sharedPrefs.getString("logged_user", "") ?: ""
-        messageAdapter = MessageAdapter(currentUserId)
+        messageAdapter = MessageAdapter(currentUser)
 
         binding.rvMessages.apply {
             layoutManager = LinearLayoutManager(this@ChatActivity).apply {
@@ -75,24 +98,21 @@ class ChatActivity : AppCompatActivity() {
 
     private fun loadMessages() {
         try {
-            val currentUser = sharedPrefs.getString("logged_user", "") ?: ""
             if (currentUser.isEmpty()) {
                 Toast.makeText(this, "Erro: Usuário não identificado", Toast.LENGTH_SHORT).show()
                 return
             }
             
-            val prefs = getSharedPreferences("users_$currentUser", Context.MODE_PRIVATE)
-            val messagesJson = prefs.getString(KEY_MESSAGES + chatId, null)
+            val messagesJson = userPrefs.getString(messagesKey, null)
 
             val messages = if (messagesJson != null) {
                 try {
-                    val type = object : TypeToken<List<Message>>() {}.type
-                    Gson().fromJson<List<Message>>(messagesJson, type) ?: getSampleMessages(currentUser)
+                    gson.fromJson<List<Message>>(messagesJson, messageListType) ?: getSampleMessages()
                 } catch (e: Exception) {
-                    getSampleMessages(currentUser)
+                    getSampleMessages()
                 }
             } else {
-                getSampleMessages(currentUser)
+                getSampleMessages()
             }
 
             messageAdapter.submitList(messages)
@@ -102,7 +122,8 @@ class ChatActivity : AppCompatActivity() {
         }
     }
 
-    private fun getSampleMessages(currentUser: String): List<Message> {
+    private fun getSampleMessages(): List<Message> {
+        val now = System.currentTimeMillis()
         val sampleMessages = listOf(
             Message(
                 id = "1",
@@ -110,16 +131,16 @@ class ChatActivity : AppCompatActivity() {
                 senderName = chatName,
                 receiverId = currentUser,
                 message = "Olá! 👋",
-                timestamp = System.currentTimeMillis() - 3600000,
+                timestamp = now - 3600000,
                 isFromMe = false
             ),
             Message(
                 id = "2",
                 senderId = currentUser,
-                senderName = sharedPrefs.getString("logged_user_name", currentUser) ?: currentUser,
+                senderName = currentUserName,
                 receiverId = chatId,
                 message = "Oi! Tudo bem?",
-                timestamp = System.currentTimeMillis() - 3500000,
+                timestamp = now - 3500000,
                 isFromMe = true
             ),
             Message(
@@ -128,51 +149,30 @@ class ChatActivity : AppCompatActivity() {
                 senderName = chatName,
                 receiverId = currentUser,
                 message = "Estou bem! E você?",
-                timestamp = System.currentTimeMillis() - 1800000,
+                timestamp = now - 1800000,
                 isFromMe = false
             )
         )
         
-        val prefs = getSharedPreferences("users_$currentUser", Context.MODE_PRIVATE)
-        prefs.edit().putString(KEY_MESSAGES + chatId, Gson().toJson(sampleMessages)).apply()
+        userPrefs.edit().putString(messagesKey, gson.toJson(sampleMessages)).apply()
         
         return sampleMessages
     }
 
     private fun sendMessage(messageText: String) {
-        val currentUser = sharedPrefs.getString("logged_user", "") ?: ""
-        val currentUserName = sharedPrefs.getString("logged_user_name", currentUser) ?: currentUser
-
+        val now = System.currentTimeMillis()
         val newMessage = Message(
-            id = System.currentTimeMillis().toString(),
+            id = now.toString(),
             senderId = currentUser,
             senderName = currentUserName,
             receiverId = chatId,
             message = messageText,
-            timestamp = System.currentTimeMillis(),
+            timestamp = now,
             isFromMe = true
         )
 
-        // Salvar mensagem
-        val prefs = getSharedPreferences("users_$currentUser", Context.MODE_PRIVATE)
-        val messagesJson = prefs.getString(KEY_MESSAGES + chatId, null)
-        val messages = if (messagesJson != null) {
-            val type = object : TypeToken<MutableList<Message>>() {}.type
-            Gson().fromJson<MutableList<Message>>(messagesJson, type)
-        } else {
-            mutableListOf()
-        }
-
-        messages.add(newMessage)
-        prefs.edit().putString(KEY_MESSAGES + chatId, Gson().toJson(messages)).apply()
-
-        // Atualizar UI
-        val currentList = messageAdapter.currentList.toMutableList()
-        currentList.add(newMessage)
-        messageAdapter.submitList(currentList)
-
+        appendMessage(newMessage)
         binding.etMessage.text?.clear()
-        binding.rvMessages.scrollToPosition(currentList.size - 1)
 
         // Simular resposta automática após 2 segundos
         simulateReply()
@@ -180,46 +180,41 @@ class ChatActivity : AppCompatActivity() {
 
     private fun simulateReply() {
         binding.root.postDelayed({
-            val replies = listOf(
-                "Entendi! 👍",
-                "Que legal! 😄",
-                "Pode me contar mais?",
-                "Ok, sem problemas!",
-                "Entendido!",
-                "Haha, muito bom! 😂",
-                "Vamos lá! 🚀",
-                "Perfeito! ✨"
-            )
             val randomReply = replies.random()
 
-            val currentUser = sharedPrefs.getString("logged_user", "") ?: ""
+            val now = System.currentTimeMillis()
             val replyMessage = Message(
-                id = System.currentTimeMillis().toString(),
+                id = now.toString(),
                 senderId = chatId,
                 senderName = chatName,
                 receiverId = currentUser,
                 message = randomReply,
-                timestamp = System.currentTimeMillis(),
+                timestamp = now,
                 isFromMe = false
             )
 
-            val prefs = getSharedPreferences("users_$currentUser", Context.MODE_PRIVATE)
-            val messagesJson = prefs.getString(KEY_MESSAGES + chatId, null)
-            val messages = if (messagesJson != null) {
-                val type = object : TypeToken<MutableList<Message>>() {}.type
-                Gson().fromJson<MutableList<Message>>(messagesJson, type)
-            } else {
-                mutableListOf()
-            }
-            messages.add(replyMessage)
-            prefs.edit().putString(KEY_MESSAGES + chatId, Gson().toJson(messages)).apply()
+            appendMessage(replyMessage)
+        }, 2000)
+    }
+
+    // Persiste a mensagem no histórico do chat e a exibe na lista
+    private fun appendMessage(message: Message) {
+        val messagesJson = userPrefs.getString(messagesKey, null)
+        val messages = if (messagesJson != null) {
+            gson.fromJson<MutableList<Message>>(messagesJson, messageListType)
+        } else {
+            mutableListOf()
+        }
 
-            val currentList = messageAdapter.currentList.toMutableList()
-            currentList.add(replyMessage)
-            messageAdapter.submitList(currentList)
+        messages.add(message)
+        userPrefs.edit().putString(messagesKey, gson.toJson(messages)).apply()
 
-            binding.rvMessages.scrollToPosition(currentList.size - 1)
-        }, 2000)
+        // Atualizar UI
+        val currentList = messageAdapter.currentList.toMutableList()
+        currentList.add(message)
+        messageAdapter.submitList(currentList)
+
+        binding.rvMessages.scrollToPosition(currentList.size - 1)
     }
 
     override fun onCreateOptionsMenu(menu: Menu?): Boolean {
@@ -22,6 +22,11 @@ class ChatsActivity : AppCompatActivity() {
 
     companion object {
         private const val KEY_CHATS = "chats"
+
+        // Tipo da lista de conversas para o Gson
+        private val chatListType = object : TypeToken<List<Chat>>() {}.type
+
+        private val gson = Gson()
     }
 
     override fun onCreate(savedInstanceState: Bundle?) {
@@ -65,42 +70,42 @@ class ChatsActivity : AppCompatActivity() {
         val chatsJson = prefs.getString("chats", null)
 
         return if (chatsJson != null) {
-            val type = object : TypeToken<List<Chat>>() {}.type
-            Gson().fromJson(chatsJson, type)
+            gson.fromJson(chatsJson, chatListType)
         } else {
             // Criar conversas de exemplo
+            val now = System.currentTimeMillis()
             val sampleChats = listOf(
                 Chat(
                     userId = "user1",
                     userName = "Maria Silva",
                     lastMessage = "Olá! Tudo bem?",
-                    lastMessageTime = System.currentTimeMillis() - 300000,
+                    lastMessageTime = now - 300000,
                     unreadCount = 2
                 ),
                 Chat(
                     userId = "user2", 
                     userName = "João Santos",
                     lastMessage = "Vamos marcar aquele café?",
-                    lastMessageTime = System.currentTimeMillis() - 3600000,
+                    lastMessageTime = now - 3600000,
                     unreadCount = 0
                 ),
                 Chat(
                     userId = "user3",
                     userName = "Ana Paula",
                     lastMessage = "Enviado uma foto",
-                    lastMessageTime = System.currentTimeMillis() - 86400000,
+                    lastMessageTime = now - 86400000,
                     unreadCount = 0
                 ),
                 Chat(
                     userId = "user4",
                     userName = "Pedro Costa",
                     lastMessage = "Obrigado! 👍",
-                    lastMessageTime = System.currentTimeMillis() - 172800000,
+                    lastMessageTime = now - 172800000,
                     unreadCount = 0
                 )
             )
             // Salvar para futuras referências
-            prefs.edit().putString("chats", Gson().toJson(sampleChats)).apply()
+            prefs.edit().putString("chats", gson.toJson(sampleChats)).apply()
             sampleChats
         }
     }
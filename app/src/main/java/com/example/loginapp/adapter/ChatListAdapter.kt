@@ -13,11 +13,21 @@ import com.example.loginapp.model.Chat
 import java.text.SimpleDateFormat
 import java.util.Date
 import java.util.Locale
+import java.util.TimeZone
 
 class ChatListAdapter(
     private val onChatClick: (Chat) -> Unit
 ) : ListAdapter<Chat, RecyclerView.ViewHolder>(ChatDiffCallback()) {
 
+    companion object {
+        private const val ONE_DAY = 24 * 60 * 60 * 1000L
+    }
+
+    // Formatadores da lista; o formatTime atualiza o fuso antes de cada uso
+    private val hourFormat = SimpleDateFormat("HH:mm", Locale.getDefault())
+    private val weekdayFormat = SimpleDateFormat("EEE", Locale.getDefault())
+    private val dateFormat = SimpleDateFormat("dd/MM/yy", Locale.getDefault())
+
     override fun onCreateViewHolder(parent: ViewGroup, viewType: Int): RecyclerView.ViewHolder {
         val view = LayoutInflater.from(parent.context)
             .inflate(R.layout.item_chat_list, parent, false)
@@ -57,19 +67,14 @@ class ChatListAdapter(
         private fun formatTime(timestamp: Long): String {
             val now = System.currentTimeMillis()
             val diff = now - timestamp
-            val oneDay = 24 * 60 * 60 * 1000
-
-            return when {
-                diff < oneDay -> {
-                    SimpleDateFormat("HH:mm", Locale.getDefault()).format(Date(timestamp))
-                }
-                diff < 7 * oneDay -> {
-                    SimpleDateFormat("EEE", Locale.getDefault()).format(Date(timestamp))
-                }
-                else -> {
-                    SimpleDateFormat("dd/MM/yy", Locale.getDefault()).format(Date(timestamp))
-                }
+            val format = when {
+                diff < ONE_DAY -> hourFormat
+                diff < 7 * ONE_DAY -> weekdayFormat
+                else -> dateFormat
             }
+
+            format.timeZone = TimeZone.getDefault()
+            return format.format(Date(timestamp))
         }
     }
 
@@ -12,17 +12,21 @@ import com.example.loginapp.model.Message
 import java.text.SimpleDateFormat
 import java.util.Date
 import java.util.Locale
+import java.util.TimeZone
 
 class MessageAdapter(private val currentUserId: String) : ListAdapter<Message, RecyclerView.ViewHolder>(MessageDiffCallback()) {
 
     companion object {
         private const val VIEW_TYPE_SENT = 1
         private const val VIEW_TYPE_RECEIVED = 2
+    }
 
-        fun formatTime(timestamp: Long): String {
-            val sdf = SimpleDateFormat("HH:mm", Locale.getDefault())
-            return sdf.format(Date(timestamp))
-        }
+    // Reutilizado entre binds; o fuso é reaplicado porque pode mudar com o app aberto
+    private val timeFormat = SimpleDateFormat("HH:mm", Locale.getDefault())
+
+    fun formatTime(timestamp: Long): String {
+        timeFormat.timeZone = TimeZone.getDefault()
+        return timeFormat.format(Date(timestamp))
     }
 
     override fun getItemViewType(position: Int): Int {
@@ -51,17 +55,17 @@ class MessageAdapter(private val currentUserId: String) : ListAdapter<Message, R
         }
     }
 
-    class SentMessageViewHolder(itemView: View) : RecyclerView.ViewHolder(itemView) {
+    inner class SentMessageViewHolder(itemView: View) : RecyclerView.ViewHolder(itemView) {
         private val tvMessage: TextView = itemView.findViewById(R.id.tvMessageSent)
         private val tvTime: TextView = itemView.findViewById(R.id.tvTimeSent)
 
         fun bind(message: Message) {
             tvMessage.text = message.message
-            tvTime.text = MessageAdapter.formatTime(message.timestamp)
+            tvTime.text = formatTime(message.timestamp)
         }
     }
 
-    class ReceivedMessageViewHolder(itemView: View) : RecyclerView.ViewHolder(itemView) {
+    inner class ReceivedMessageViewHolder(itemView: View) : RecyclerView.ViewHolder(itemView) {
         private val tvMessage: TextView = itemView.findViewById(R.id.tvMessageReceived)
         private val tvTime: TextView = itemView.findViewById(R.id.tvTimeReceived)
         private val tvSender: TextView = itemView.findViewById(R.id.tvSenderName)
@@ -69,7 +73,7 @@ class MessageAdapter(private val currentUserId: String) : ListAdapter<Message, R
         fun bind(message: Message) {
             tvMessage.text = message.message
             tvSender.text = message.senderName
-            tvTime.text = MessageAdapter.formatTime(message.timestamp)
+            tvTime.text = formatTime(message.timestamp)
         }
     }
 